@@ -1,6 +1,86 @@
 import AlteryxPythonSDK as Sdk
 import xml.etree.ElementTree as Et
 import base64
+from functools import lru_cache, partial
+from typing import Callable, List, Optional, Tuple
+
+# pybase64 wraps a SIMD-accelerated base64 codec; fall back to the stdlib
+# when it isn't installed in the Alteryx Python environment.
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
+# Number of incoming records buffered before the codec/push loop runs.
+BATCH_SIZE = 512
+
+# Encode inputs larger than the threshold run through the codec in chunks, so
+# a huge field value doesn't allocate its whole encoded image in one piece.
+# The chunk size is a multiple of 15 bytes, keeping it aligned with both the
+# 3-byte base64 and 5-byte base32 input blocks so no padding appears mid-stream.
+LARGE_VALUE_THRESHOLD = 65536
+ENCODE_CHUNK_SIZE = 245760
+
+# Values shorter than this are served from a bounded result cache, so
+# low-cardinality columns skip the codec entirely on repeated values.
+CACHED_VALUE_LIMIT = 256
+
+# Codec dispatch tables, keyed by the EncodingMethod value from the GUI.
+# The base64 paths prefer the SIMD-backed pybase64 codecs; b32/b16 have no
+# pybase64 equivalent and stay on the stdlib.
+_b64_module = pybase64 if pybase64 is not None else base64
+
+_ENCODERS = {
+    'b64_standard': _b64_module.standard_b64encode,
+    'b64_url_safe': _b64_module.urlsafe_b64encode,
+    'b32': base64.b32encode,
+    'b16': base64.b16encode
+}
+
+_DECODERS = {
+    'b64_standard': _b64_module.standard_b64decode,
+    'b64_url_safe': _b64_module.urlsafe_b64decode,
+    'b32': base64.b32decode,
+    'b16': base64.b16decode
+}
+
+# With pybase64, validate the base64 alphabet in the SIMD path and reject bad
+# input with an error instead of silently discarding non-alphabet characters.
+if pybase64 is not None:
+    _DECODERS['b64_standard'] = partial(pybase64.b64decode, validate=True)
+    _DECODERS['b64_url_safe'] = partial(pybase64.b64decode, altchars=b'-_', validate=True)
+
+def _codec_backend_description() -> str:
+    """
+    Describes the active base64 backend and, when pybase64 can report it, the
+    SIMD tier its runtime dispatch selected.
+    """
+
+    if pybase64 is None:
+        return "stdlib base64 (scalar)"
+
+    description = f"pybase64 {pybase64.get_version()}"
+
+    # The SIMD probe moved between pybase64 versions; check both homes.
+    get_simd_name = getattr(pybase64, 'get_simd_name',
+                            getattr(getattr(pybase64, '_pybase64', None), 'get_simd_name', None))
+    if get_simd_name is not None:
+        try:
+            description = f"{description} ({get_simd_name()} SIMD)"
+        except TypeError:
+            pass
+
+    return description
+
+@lru_cache(maxsize=8192)
+def _transform_cached(codec: Callable[[bytes], bytes], field_data: str,
+                      input_charset: str, output_charset: str) -> str:
+    """
+    Pure str-to-str codec call, memoized for short values so repeated inputs
+    (e.g. low-cardinality category columns) bypass the codec.
+    """
+
+    return codec(field_data.encode(input_charset)).decode(output_charset)
 
 class AyxPlugin:
     """
@@ -35,14 +115,27 @@ class AyxPlugin:
         :param str_xml: The raw XML from the GUI.
         """
 
-        # Getting the dataName data property from the Gui.html
-        self.field_selection = Et.fromstring(str_xml).find('EncodeField').text if 'EncodeField' in str_xml else None
-        self.method = Et.fromstring(str_xml).find('Method').text if 'Method' in str_xml else None
-        self.encoding_method = Et.fromstring(str_xml).find('EncodingMethod').text if 'EncodingMethod' in str_xml else None
+        # Getting the dataName data properties from the Gui.html, parsing the
+        # configuration XML once instead of once per property.
+        root = Et.fromstring(str_xml)
+
+        def get_text(tag: str):
+            element = root.find(tag)
+            return element.text if element is not None else None
+
+        self.field_selection = get_text('EncodeField')
+        self.method = get_text('Method')
+        self.encoding_method = get_text('EncodingMethod')
 
         # Getting the output anchor from Config.xml by the output connection name
         self.output_anchor = self.output_anchor_mgr.get_output_anchor('Output')
 
+        # Report the active codec backend, so a runtime silently falling back
+        # to the scalar stdlib codec is visible in the results window.
+        self.alteryx_engine.output_message(self.n_tool_id,
+                                        Sdk.EngineMessageType.info,
+                                        "base64 backend: "+_codec_backend_description())
+
     def pi_add_incoming_connection(self, str_type: str, str_name: str):
         """
         The IncomingInterface objects are instantiated here, one object per incoming connection.
@@ -104,9 +197,29 @@ class IncomingInterface:
 
         # Custom properties
         self.record_copier = None
-        self.record_creator = None
+        self._codec: Optional[Callable[[bytes], bytes]] = None
 
-    def ii_init(self, record_info_in: object):
+        # Direction-specialized transform, bound to _transform_encode or
+        # _transform_decode in ii_init.
+        self.transform_data: Optional[Callable[[str], str]] = None
+
+        # Batching state: pending (record_creator, field_data) pairs and the
+        # pool of record creators reused from batch to batch.
+        self._pending: List[Tuple[object, str]] = []
+        self._creator_pool: List[object] = []
+        self._record_info_out = None
+
+        # Scratch buffer reused for chunked-encode output, so large values
+        # don't reallocate an output buffer per record.
+        self._scratch = bytearray()
+
+        # Hot-path bindings, resolved in ii_init
+        self._get_field_data: Optional[Callable] = None
+        self._set_field_data: Optional[Callable] = None
+        self._copy_record: Optional[Callable] = None
+        self._push_record: Optional[Callable] = None
+
+    def ii_init(self, record_info_in: object) -> bool:
         """
         Handles appending the new field to the incoming data.
         Called to report changes of the incoming connection's record metadata to the Alteryx engine.
@@ -120,26 +233,40 @@ class IncomingInterface:
         if not self.parent.field_selection:
             self.parent.alteryx_engine.output_message(self.parent.n_tool_id, 
                                                     Sdk.EngineMessageType.error, 
-                                                    "Select a Field to "+str(self.parent.method))
+                                                    f"Select a Field to {self.parent.method}")
             return False
         else:
             # Encoded/decoded column name and description
-            altered_column_name = str(self.parent.field_selection)+"_"+str(self.parent.method)
-            altered_description = str(self.parent.encoding_method)+" "+str(self.parent.method)
+            altered_column_name = f"{self.parent.field_selection}_{self.parent.method}"
+            altered_description = f"{self.parent.encoding_method} {self.parent.method}"
+
+        # Resolve the codec function once, so push_record doesn't re-select it
+        # for every record. An unset/unknown encoding method is a configuration
+        # error, reported here so the per-record path can assume a codec.
+        codec_table = _ENCODERS if self.parent.method == 'encode' else _DECODERS
+        self._codec = codec_table.get(self.parent.encoding_method)
+        if self._codec is None:
+            self.parent.alteryx_engine.output_message(self.parent.n_tool_id,
+                                                    Sdk.EngineMessageType.error,
+                                                    "Select an Encoding Method")
+            return False
 
         # Returns a new, empty RecordCreator object that is identical to record_info_in.
         record_info_out = record_info_in.clone()
 
         # Adds field to record with specified name and output type.
-        record_info_out.add_field(altered_column_name, Sdk.FieldType.v_wstring, 1073741823, 0, str(altered_description))
+        record_info_out.add_field(altered_column_name, Sdk.FieldType.v_wstring, 1073741823, 0, altered_description)
 
         # Lets the downstream tools know what the outgoing record metadata will look like, based on record_info_out.
         self.parent.output_anchor.init(record_info_out)
 
-        # Creating a new, empty record creator based on record_info_out's record layout.
-        self.record_creator = record_info_out.construct_record_creator()
+        # Keep the outgoing layout around; record creators for the batch pool
+        # are constructed from it on demand in ii_push_record.
+        self._record_info_out = record_info_out
 
-        # Instantiate a new instance of the RecordCopier class.
+        # Instantiate a new instance of the RecordCopier class. The SDK exposes
+        # no raw-buffer record copy, but with the 1-to-1 prefix mapping below a
+        # single copy() call moves every input field in one C-level pass.
         self.record_copier = Sdk.RecordCopier(record_info_out, record_info_in)
 
         # Map each column of the input to where we want in the output.
@@ -153,42 +280,90 @@ class IncomingInterface:
         # Grab the index of our new field in the record, so we don't have to do a string lookup on every push_record.
         self.parent.output_field = record_info_out[record_info_out.get_field_num(altered_column_name)]
         self.parent.input_field = record_info_out[record_info_out.get_field_num(self.parent.field_selection)]
-        
+
+        # The baseN side of the codec is always ASCII, so use the ASCII codec there
+        # (a plain memcpy) and keep UTF-8 only for the side holding arbitrary field data.
+        # Specialize the transform once per connection: each direction gets a
+        # straight-line method with its charsets fixed, so the per-record path
+        # carries no direction branch. Binding onto the instance shadows the
+        # generic name with the chosen specialization.
+        if self.parent.method == 'encode':
+            self.transform_data = self._transform_encode
+        else:
+            self.transform_data = self._transform_decode
+
+        # Pre-bind the methods used for every record, so push_record pays one
+        # local lookup per call instead of chained attribute lookups.
+        self._get_field_data = self.parent.input_field.get_as_string
+        self._set_field_data = self.parent.output_field.set_from_string
+        self._copy_record = self.record_copier.copy
+        self._push_record = self.parent.output_anchor.push_record
+
         return True
 
-    def ii_push_record(self, in_record: object):
+    def ii_push_record(self, in_record: object) -> bool:
         """
         Responsible for pushing records out, under a count limit set by the user in n_record_select.
         Called when an input record is being sent to the plugin.
         :param in_record: The data for the incoming record.
         :return: False if method calling limit (record_cnt) is hit.
         """
-        if not self.parent.is_initialized:
-            return False
 
-        # Copy the data from the incoming record into the outgoing record.
-        self.record_creator.reset()
-        self.record_copier.copy(self.record_creator, in_record)
-
-        if self.parent.method == 'encode':
-            # Encode the selected field's data
-            altered_field_data = self.encode_data(in_record)
+        # No is_initialized check here: ii_init already gates on it (and fails
+        # the connection), and nothing flips it back once records are flowing.
+
+        # Copy the incoming record eagerly - the engine is free to recycle the
+        # in_record buffer as soon as this method returns.
+        pending = self._pending
+        pool = self._creator_pool
+        if len(pool) > len(pending):
+            # reset() is only needed when reusing a creator: the fixed-width
+            # fields are fully overwritten by copy()/set_from_string, but the
+            # v_wstring var-data region grows across records without it.
+            record_creator = pool[len(pending)]
+            record_creator.reset()
         else:
-            # Decode the selected field's data
-            altered_field_data = self.decode_data(in_record)
+            record_creator = self._record_info_out.construct_record_creator()
+            pool.append(record_creator)
+        self._copy_record(record_creator, in_record)
 
-        # Sets the value of this field in the specified record_creator from an int64 value.
-        self.parent.output_field.set_from_string(self.record_creator, altered_field_data)
+        # Buffer the record alongside the selected field's data; the codec and
+        # the downstream push run per batch in _flush_pending.
+        pending.append((record_creator, self._get_field_data(in_record)))
 
-        # Finalize the outgoing record
-        out_record = self.record_creator.finalize_record()
-
-        # Push the record downstream and quit if there's a downstream error.
-        if not self.parent.output_anchor.push_record(out_record):
-            return False
+        if len(pending) >= BATCH_SIZE:
+            return self._flush_pending()
 
         return True
 
+    def _flush_pending(self) -> bool:
+        """
+        Runs the codec and pushes every buffered record downstream in one tight
+        loop, so per-record method lookups are paid once per batch.
+        :return: False if a downstream error stopped the push, otherwise True.
+        """
+
+        pending = self._pending
+        if not pending:
+            return True
+
+        transform_data = self.transform_data
+        set_field_data = self._set_field_data
+        push_record = self._push_record
+
+        no_error = True
+        for record_creator, field_data in pending:
+            set_field_data(record_creator, transform_data(field_data))
+
+            # Push the record downstream and quit if there's a downstream error.
+            if not push_record(record_creator.finalize_record()):
+                no_error = False
+                break
+
+        del pending[:]
+
+        return no_error
+
     def ii_update_progress(self, d_percent: float):
         """
         Called by the upstream tool to report what percentage of records have been pushed.
@@ -206,65 +381,63 @@ class IncomingInterface:
         Called when the incoming connection has finished passing all of its records.
         """
 
+        # Push out whatever is left of the final, partial batch.
+        self._flush_pending()
+
         # Close outgoing connections.
         self.parent.output_anchor.close()
 
-    def encode_data(self, in_record: object):
+    def _transform_encode(self, field_data_original: str) -> str:
         """
-        Non-Incoming Interface function that's used to encodes the 
-        selected field data using the base64 library method specified
+        Non-Incoming Interface function that's used to encode the selected
+        field data; bound to transform_data by ii_init for encode connections.
         """
 
-        # Access the data associated with the selected field
-        field_data_original = self.parent.input_field.get_as_string(in_record)
-        
-        # Encode original data as bytes
-        field_data_bytes = field_data_original.encode('utf-8')
-        
-        # Enode the field_data_bytes as specified
-        if self.parent.encoding_method == "b64_standard":
-            field_data_encoded = base64.standard_b64encode(field_data_bytes)            
-        elif self.parent.encoding_method == "b64_url_safe":
-            field_data_encoded = base64.urlsafe_b64encode(field_data_bytes)            
-        elif self.parent.encoding_method == "b32":
-            field_data_encoded = base64.b32encode(field_data_bytes)            
-        elif self.parent.encoding_method == "b16":
-            field_data_encoded = base64.b16encode(field_data_bytes)            
-        else:
-            # Default to outputting the original data if no method selected
-            return(field_data_original)
-
-        # Convert encoded data back to str - removes b'' wrapper
-        field_data_encoded = str(field_data_encoded.decode('utf-8'))
+        # Serve short values from the memoized codec call; repeated values in
+        # low-cardinality columns skip the codec after the first occurrence.
+        if len(field_data_original) < CACHED_VALUE_LIMIT:
+            return(_transform_cached(self._codec, field_data_original, 'utf-8', 'ascii'))
 
-        return(field_data_encoded)
+        # Encode original data as bytes. The SDK offers no raw-bytes accessor
+        # for string fields (get_as_blob only covers blob fields), so the
+        # wide-string-to-str-to-bytes round trip here is unavoidable; CPython's
+        # compact-ASCII representation already makes it a memcpy for ASCII data.
+        field_data_bytes = field_data_original.encode('utf-8')
 
-    def decode_data(self, in_record: object):
+        # Encode very large values in aligned chunks, capping the transient
+        # peak at roughly one chunk's encoded image instead of the whole value.
+        if len(field_data_bytes) > LARGE_VALUE_THRESHOLD:
+            codec = self._codec
+
+            # Slice the input through a memoryview: the codecs take any buffer,
+            # and a view slice shares the underlying bytes where a bytes slice
+            # would copy each chunk before encoding it.
+            field_data_view = memoryview(field_data_bytes)
+
+            # Write the encoded chunks into the persistent scratch buffer; it
+            # keeps the capacity of the largest value seen, so subsequent large
+            # records reuse the allocation instead of growing a new bytearray.
+            scratch = self._scratch
+            position = 0
+            for start in range(0, len(field_data_bytes), ENCODE_CHUNK_SIZE):
+                encoded_chunk = codec(field_data_view[start:start + ENCODE_CHUNK_SIZE])
+                scratch[position:position + len(encoded_chunk)] = encoded_chunk
+                position += len(encoded_chunk)
+            return(str(memoryview(scratch)[:position], 'ascii'))
+
+        # Run the bytes through the resolved codec, back to str - removes b'' wrapper
+        return(self._codec(field_data_bytes).decode('ascii'))
+
+    def _transform_decode(self, field_data_original: str) -> str:
         """
-        Non-Incoming Interface function that's used to decode the 
-        selected field data using the base64 library method specified
+        Non-Incoming Interface function that's used to decode the selected
+        field data; bound to transform_data by ii_init for decode connections.
         """
 
-        # Access the data associated with the selected field
-        field_data_original = self.parent.input_field.get_as_string(in_record)
-        
-        # Encode original data as bytes
-        field_data_bytes = field_data_original.encode('utf-8')
-        
-        # Enode the field_data_bytes as specified
-        if self.parent.encoding_method == "b64_standard":
-            field_data_decoded = base64.standard_b64decode(field_data_bytes)            
-        elif self.parent.encoding_method == "b64_url_safe":
-            field_data_decoded = base64.urlsafe_b64decode(field_data_bytes)            
-        elif self.parent.encoding_method == "b32":
-            field_data_decoded = base64.b32decode(field_data_bytes)            
-        elif self.parent.encoding_method == "b16":
-            field_data_decoded = base64.b16decode(field_data_bytes)            
-        else:
-            # Default to outputting the original data if no method selected
-            return(field_data_original)
-
-        # Convert encoded data back to str - removes b'' wrapper
-        field_data_decoded = str(field_data_decoded.decode('utf-8'))
+        # Serve short values from the memoized codec call; repeated values in
+        # low-cardinality columns skip the codec after the first occurrence.
+        if len(field_data_original) < CACHED_VALUE_LIMIT:
+            return(_transform_cached(self._codec, field_data_original, 'ascii', 'utf-8'))
 
-        return(field_data_decoded)
\ No newline at end of file
+        # Run the bytes through the resolved codec, back to str - removes b'' wrapper
+        return(self._codec(field_data_original.encode('ascii')).decode('utf-8'))
\ No newline at end of file